@@ -1,51 +1,326 @@
+import asyncio
+import math
+import re
+import sys
 import time
+from collections import Counter, OrderedDict
 
 # Global Quiz Cache (Database)
-QUIZ_CACHE = {}
+# Keys are interned (sys.intern) so repeated lookups hit the identity fast path.
+# Bounded LRU of content quizzes: the least recently used one is evicted past
+# MAX_CACHE_SIZE. Evicted content is simply regenerated on its next upload.
+MAX_CACHE_SIZE = 1000
+QUIZ_CACHE = OrderedDict()
 
+# Weekly checkpoint quizzes live in their own key space, so content named
+# like a checkpoint (e.g. "Week 1 Checkpoint") can never collide with one.
+# They are never evicted: a checkpoint accumulates questions from every
+# upload of its week and can't be regenerated by an LLM call. Memory stays
+# bounded by the number of weeks, since each checkpoint keeps only its
+# newest MAX_CHECKPOINT_QUESTIONS.
+MAX_CHECKPOINT_QUESTIONS = 100
+CHECKPOINT_CACHE = {}
 
-def admin_upload_content(content_name, week_id):
+# Memoization: previously processed content is never sent to the LLM again.
+# Optionally, near-duplicate names (e.g. re-exported files) reuse the closest
+# cached quiz. Off by default: file names alone can't prove identical content.
+# Names that differ in any number (chapter, week, version) never match.
+SEMANTIC_MATCHING = False
+SIMILARITY_THRESHOLD = 0.85
+_NUMBER_PATTERN = re.compile(r"\d+")
+_EMBEDDING_INDEX = {}  # content_name -> (vector, norm, numbers) per content quiz
+# Uploads still being generated; repeat uploads wait on these instead of
+# paying for a second LLM call
+_IN_PROGRESS = {}  # content_name -> Future resolving to the content quiz
+
+# Upload batching: pending (content_name, week_id, future) entries are
+# collected for up to BATCH_WINDOW seconds and sent as one LLM batch call
+BATCH_SIZE = 8
+BATCH_WINDOW = 0.05
+_upload_queue = None  # created per event loop, see get_upload_queue()
+_upload_queue_loop = None
+
+_BAR80 = "=" * 80
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Fixed question templates; only the content name varies per upload
+_QUESTION_TEMPLATES = (
+    "Question 1 about {name}",
+    "Question 2 about {name}",
+    "Question 3 about {name}"
+)
+_CHECKPOINT_TEMPLATES = (
+    "Checkpoint question from {name} - Part 1",
+    "Checkpoint question from {name} - Part 2"
+)
+
+
+class QuizRecord:
     """
-    Simulates the slow, one-time task of processing content on the Admin's side.
-    Generates and caches quizzes for instant student access.
+    A cached quiz. Uses __slots__ so each record is a small fixed-layout
+    object and field reads are attribute loads rather than dict lookups.
     """
-    print(f"\n[ADMIN] Uploading content: '{content_name}' for {week_id}...")
-    print("[ADMIN] Starting AI-powered quiz generation (this is the slow part)...")
+    __slots__ = ("quiz_id", "questions", "generated_at")
     
-    start_time = time.time()
+    def __init__(self, quiz_id, questions, generated_at):
+        self.quiz_id = quiz_id
+        self.questions = questions
+        self.generated_at = generated_at
+
+
+def cache_quiz(quiz_id, quiz):
+    """
+    Inserts a content quiz as the most recently used entry and evicts the
+    least recently used ones once the cache grows past MAX_CACHE_SIZE.
+    Checkpoint quizzes never go through here (see CHECKPOINT_CACHE).
+    """
+    QUIZ_CACHE[quiz_id] = quiz
+    QUIZ_CACHE.move_to_end(quiz_id)
+    
+    while len(QUIZ_CACHE) > MAX_CACHE_SIZE:
+        evicted_id, _ = QUIZ_CACHE.popitem(last=False)
+        _EMBEDDING_INDEX.pop(evicted_id, None)
+
+
+def get_cached_quiz(quiz_id):
+    """
+    Looks up a quiz and marks it as most recently used on a hit.
+    """
+    quiz = QUIZ_CACHE.get(quiz_id)
+    if quiz is not None:
+        QUIZ_CACHE.move_to_end(quiz_id)
+    return quiz
+
+
+def get_upload_queue():
+    """
+    Returns the upload queue for the running event loop.
+    asyncio queues bind to the loop that first uses them, so a new queue is
+    created whenever the loop changes (e.g. across separate asyncio.run calls).
+    """
+    global _upload_queue, _upload_queue_loop
     
+    loop = asyncio.get_running_loop()
+    if _upload_queue is None or _upload_queue_loop is not loop:
+        _upload_queue = asyncio.Queue()
+        _upload_queue_loop = loop
+    return _upload_queue
+
+
+def lookup_quiz(quiz_id):
+    """
+    Student-facing lookup across both quiz kinds. A checkpoint quiz takes
+    precedence over content that happens to share its name.
+    """
+    quiz = CHECKPOINT_CACHE.get(quiz_id)
+    if quiz is None:
+        quiz = get_cached_quiz(quiz_id)
+    return quiz
+
+
+def embed_content_name(content_name):
+    """
+    Cheap bag-of-trigrams embedding of a content name.
+    Returns the trigram counts together with their vector norm.
+    """
+    text = content_name.lower()
+    vector = Counter(text[i:i + 3] for i in range(len(text) - 2))
+    norm = math.sqrt(sum(count * count for count in vector.values()))
+    return vector, norm
+
+
+def find_cached_quiz(content_name):
+    """
+    Returns an already generated quiz for this content, or None.
+    Exact name matches are checked first; if SEMANTIC_MATCHING is on, the most
+    similar previously processed content with the same numbers in its name
+    is reused when it clears SIMILARITY_THRESHOLD.
+    """
+    cached_quiz = get_cached_quiz(content_name)
+    if cached_quiz is not None or not SEMANTIC_MATCHING:
+        return cached_quiz
+    
+    vector, norm = embed_content_name(content_name)
+    if not norm:
+        return None
+    numbers = _NUMBER_PATTERN.findall(content_name)
+    
+    best_score, best_match = 0.0, None
+    for cached_name, (cached_vector, cached_norm, cached_numbers) in _EMBEDDING_INDEX.items():
+        if cached_numbers != numbers:
+            continue
+        dot = sum(count * cached_vector[gram] for gram, count in vector.items())
+        score = dot / (norm * cached_norm)
+        if score > best_score:
+            best_score, best_match = score, cached_name
+    
+    if best_score > SIMILARITY_THRESHOLD:
+        matched_quiz = get_cached_quiz(best_match)
+        # Cache the shared questions under the new name so students can
+        # retrieve it directly and see the id they asked for
+        cached_quiz = QuizRecord(
+            quiz_id=content_name,
+            questions=matched_quiz.questions,
+            generated_at=matched_quiz.generated_at
+        )
+        cache_quiz(content_name, cached_quiz)
+        return cached_quiz
+    return None
+
+
+async def generate_with_llm(content_names):
+    """
+    Simulates one AI/LLM batch call covering every content item at once.
+    The per-call latency is paid once per batch, not once per upload.
+    """
     # Simulate the slow AI/LLM processing delay (5-8 seconds)
-    time.sleep(7)
+    await asyncio.sleep(7)
+
+
+def cache_generated_quizzes(content_name, week_id):
+    """
+    Stores the generated content quiz and updates the weekly checkpoint quiz.
+    Runs without awaiting, so the cache is updated atomically on the event loop.
+    Returns the new content quiz record and the checkpoint quiz id.
+    """
+    content_name = sys.intern(content_name)
+    now_str = time.strftime(TIMESTAMP_FORMAT)
     
     # Generate Content-Specific Quiz
-    content_quiz = {
-        "quiz_id": content_name,
-        "questions": [
-            f"Question 1 about {content_name}",
-            f"Question 2 about {content_name}",
-            f"Question 3 about {content_name}"
-        ],
-        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S")
-    }
-    QUIZ_CACHE[content_name] = content_quiz
+    content_quiz = QuizRecord(
+        quiz_id=content_name,
+        questions=tuple(
+            template.format(name=content_name) for template in _QUESTION_TEMPLATES
+        ),
+        generated_at=now_str
+    )
+    cache_quiz(content_name, content_quiz)
+    
+    vector, norm = embed_content_name(content_name)
+    if norm:
+        _EMBEDDING_INDEX[content_name] = (
+            vector, norm, _NUMBER_PATTERN.findall(content_name)
+        )
     
+    checkpoint_quiz_id = update_checkpoint_quiz(content_name, week_id, now_str)
+    
+    return content_quiz, checkpoint_quiz_id
+
+
+def update_checkpoint_quiz(content_name, week_id, now_str):
+    """
+    Adds this content's questions to the weekly checkpoint quiz, creating it
+    if needed. Needs no LLM call, so it also runs when a cached quiz is reused.
+    Returns the checkpoint quiz id.
+    """
     # Generate/Update Weekly Checkpoint Quiz
-    checkpoint_quiz_id = f"{week_id} Checkpoint"
+    checkpoint_quiz_id = sys.intern(f"{week_id} Checkpoint")
     
     # Check if checkpoint quiz already exists, if not create it
-    if checkpoint_quiz_id not in QUIZ_CACHE:
-        QUIZ_CACHE[checkpoint_quiz_id] = {
-            "quiz_id": checkpoint_quiz_id,
-            "questions": [],
-            "generated_at": time.strftime("%Y-%m-%d %H:%M:%S")
-        }
-    
-    # Add new questions to the weekly checkpoint quiz
-    new_checkpoint_questions = [
-        f"Checkpoint question from {content_name} - Part 1",
-        f"Checkpoint question from {content_name} - Part 2"
-    ]
-    QUIZ_CACHE[checkpoint_quiz_id]["questions"].extend(new_checkpoint_questions)
+    checkpoint_quiz = CHECKPOINT_CACHE.get(checkpoint_quiz_id)
+    if checkpoint_quiz is None:
+        checkpoint_quiz = QuizRecord(
+            quiz_id=checkpoint_quiz_id,
+            # Keyed by question text: insertion-ordered with O(1) dedup
+            questions={},
+            generated_at=now_str
+        )
+        CHECKPOINT_CACHE[checkpoint_quiz_id] = checkpoint_quiz
+    
+    # Add new questions to the weekly checkpoint quiz (duplicates are no-ops)
+    questions = checkpoint_quiz.questions
+    questions.update(dict.fromkeys(
+        template.format(name=content_name) for template in _CHECKPOINT_TEMPLATES
+    ))
+    
+    # Drop the oldest questions once the checkpoint reaches its cap
+    while len(questions) > MAX_CHECKPOINT_QUESTIONS:
+        del questions[next(iter(questions))]
+    
+    return checkpoint_quiz_id
+
+
+def reuse_cached_quiz(content_name, week_id):
+    """
+    Memo-hit path shared by both upload entry points. If the content was
+    already processed, adds it to this week's checkpoint (no LLM call needed)
+    and returns the cached quiz; otherwise returns None.
+    """
+    cached_quiz = find_cached_quiz(content_name)
+    if cached_quiz is None:
+        return None
+    
+    checkpoint_quiz_id = update_checkpoint_quiz(
+        content_name, week_id, time.strftime(TIMESTAMP_FORMAT)
+    )
+    print(f"[ADMIN] ✓ Reusing cached quiz '{cached_quiz.quiz_id}' (no regeneration needed)")
+    print(f"[ADMIN] ✓ Updated '{checkpoint_quiz_id}' quiz")
+    return cached_quiz
+
+
+def track_in_progress(content_name, future):
+    """
+    Registers an upload that is being generated until its Future is done.
+    """
+    def forget(done):
+        if _IN_PROGRESS.get(content_name) is done:
+            del _IN_PROGRESS[content_name]
+    
+    _IN_PROGRESS[content_name] = future
+    future.add_done_callback(forget)
+
+
+async def join_in_progress_upload(content_name, week_id, pending):
+    """
+    Waits for an in-progress upload of the same content, then adds the
+    content to this week's checkpoint. Shielded, so cancelling one waiter
+    doesn't cancel the shared generation.
+    """
+    print(f"[ADMIN] ✓ '{content_name}' is already being generated; sharing that result")
+    content_quiz = await asyncio.shield(pending)
+    checkpoint_quiz_id = update_checkpoint_quiz(
+        content_name, week_id, time.strftime(TIMESTAMP_FORMAT)
+    )
+    print(f"[ADMIN] ✓ Updated '{checkpoint_quiz_id}' quiz")
+    return content_quiz
+
+
+async def admin_upload_content(content_name, week_id):
+    """
+    Simulates the slow, one-time task of processing content on the Admin's side.
+    Generates and caches quizzes for instant student access.
+    Content that was already processed is returned from the cache instantly.
+    """
+    content_name = sys.intern(content_name)
+    print(f"\n[ADMIN] Uploading content: '{content_name}' for {week_id}...")
+    
+    cached_quiz = reuse_cached_quiz(content_name, week_id)
+    if cached_quiz is not None:
+        return cached_quiz
+    
+    pending = _IN_PROGRESS.get(content_name)
+    if pending is not None:
+        return await join_in_progress_upload(content_name, week_id, pending)
+    
+    generation = asyncio.get_running_loop().create_future()
+    track_in_progress(content_name, generation)
+    
+    print("[ADMIN] Starting AI-powered quiz generation (this is the slow part)...")
+    
+    start_time = time.time()
+    
+    try:
+        await generate_with_llm([content_name])
+        content_quiz, checkpoint_quiz_id = cache_generated_quizzes(content_name, week_id)
+    except BaseException as error:
+        # Waiters get the same outcome; this caller re-raises it directly
+        if isinstance(error, Exception):
+            generation.set_exception(error)
+            generation.exception()
+        else:
+            generation.cancel()
+        raise
+    generation.set_result(content_quiz)
     
     end_time = time.time()
     elapsed_time = end_time - start_time
@@ -54,6 +329,124 @@ def admin_upload_content(content_name, week_id):
     print(f"[ADMIN] ✓ Cached quiz for: '{content_name}'")
     print(f"[ADMIN] ✓ Updated '{checkpoint_quiz_id}' quiz")
     print(f"[ADMIN] Total processing time: {elapsed_time:.2f} seconds")
+    
+    return content_quiz
+
+
+async def schedule_upload(content_name, week_id):
+    """
+    Queues content for batched quiz generation and returns immediately.
+    The returned Future resolves once the batch containing it is cached,
+    or right away if the content was already processed. Uploads of content
+    that is already queued or generating share that upload's result.
+    Queued uploads are only processed while a batch_worker() task runs on the
+    same event loop; without one the Future never resolves. If the worker
+    stops, its pending Futures are cancelled or failed.
+    """
+    content_name = sys.intern(content_name)
+    loop = asyncio.get_running_loop()
+    
+    cached_quiz = reuse_cached_quiz(content_name, week_id)
+    if cached_quiz is not None:
+        future = loop.create_future()
+        future.set_result(cached_quiz)
+        return future
+    
+    # Same content already queued or generating: share its result
+    pending = _IN_PROGRESS.get(content_name)
+    if pending is not None:
+        return asyncio.ensure_future(join_in_progress_upload(content_name, week_id, pending))
+    
+    future = loop.create_future()
+    track_in_progress(content_name, future)
+    await get_upload_queue().put((content_name, week_id, future))
+    print(f"[ADMIN] Queued content: '{content_name}' for {week_id}")
+    return future
+
+
+async def batch_worker(max_batch_size=BATCH_SIZE, batch_window=BATCH_WINDOW):
+    """
+    Background worker that drains the upload queue in batches.
+    Waits for the first pending upload, then gathers more for up to
+    batch_window seconds (or max_batch_size items) before one LLM call.
+    """
+    loop = asyncio.get_running_loop()
+    queue = get_upload_queue()
+    
+    while True:
+        batch = []
+        try:
+            batch.append(await queue.get())
+            deadline = loop.time() + batch_window
+            
+            while len(batch) < max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            print(f"\n[ADMIN] Starting AI-powered quiz generation for a batch of {len(batch)}...")
+            start_time = time.time()
+            
+            try:
+                await generate_with_llm(list(dict.fromkeys(
+                    content_name for content_name, _, _ in batch
+                )))
+            except Exception as error:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            
+            # No awaits in this loop, so the whole batch lands in the cache at once.
+            # Failures are reported per item so the worker keeps serving the queue.
+            for content_name, week_id, future in batch:
+                try:
+                    content_quiz, checkpoint_quiz_id = cache_generated_quizzes(content_name, week_id)
+                except Exception as error:
+                    print(f"[ADMIN] ✗ Failed to cache quiz for: '{content_name}' ({error})")
+                    if not future.done():
+                        future.set_exception(error)
+                    continue
+                
+                if not future.done():
+                    future.set_result(content_quiz)
+                print(f"[ADMIN] ✓ Cached quiz for: '{content_name}'")
+                print(f"[ADMIN] ✓ Updated '{checkpoint_quiz_id}' quiz")
+            
+            elapsed_time = time.time() - start_time
+            print(f"[ADMIN] Total batch processing time: {elapsed_time:.2f} seconds")
+        except BaseException as error:
+            # The worker is stopping (cancelled or crashed): settle every
+            # upload it still owes an answer so no caller waits forever
+            settle_pending_uploads(batch, queue, error)
+            raise
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def settle_pending_uploads(batch, queue, error):
+    """
+    Resolves the futures of the in-flight batch and of every upload still
+    waiting in the queue when batch_worker stops. They are cancelled if the
+    worker was cancelled, otherwise they receive the worker's exception.
+    """
+    pending = list(batch)
+    while not queue.empty():
+        pending.append(queue.get_nowait())
+        queue.task_done()
+    
+    for _, _, future in pending:
+        if future.done():
+            continue
+        if isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            future.cancel()
 
 
 def retrieve_quiz_instantly(quiz_id):
@@ -61,36 +454,73 @@ def retrieve_quiz_instantly(quiz_id):
     Universal, instant quiz retrieval function.
     CRITICAL: NO time.sleep() delay - demonstrates instant access for students.
     """
-    print(f"\n[STUDENT] Requesting quiz: '{quiz_id}'...")
+    quiz_id = sys.intern(quiz_id)
+    lines = [f"\n[STUDENT] Requesting quiz: '{quiz_id}'..."]
     
     start_time = time.time()
     
-    # Instant lookup from cache
-    if quiz_id in QUIZ_CACHE:
-        quiz_data = QUIZ_CACHE[quiz_id]
+    # Instant lookup from cache (single hash + probe)
+    quiz_data = lookup_quiz(quiz_id)
+    if quiz_data is not None:
         end_time = time.time()
         elapsed_time = end_time - start_time
         
-        print(f"[STUDENT] ✓ Quiz retrieved instantly!")
-        print(f"[STUDENT] Quiz ID: {quiz_data['quiz_id']}")
-        print(f"[STUDENT] Questions: {len(quiz_data['questions'])}")
-        for i, question in enumerate(quiz_data['questions'], 1):
-            print(f"           {i}. {question}")
-        print(f"[STUDENT] Retrieval time: {elapsed_time:.6f} seconds (INSTANT!)")
+        lines.append("[STUDENT] ✓ Quiz retrieved instantly!")
+        lines.append(f"[STUDENT] Quiz ID: {quiz_data.quiz_id}")
+        lines.append(f"[STUDENT] Questions: {len(quiz_data.questions)}")
+        lines.extend(
+            f"           {i}. {question}"
+            for i, question in enumerate(quiz_data.questions, 1)
+        )
+        lines.append(f"[STUDENT] Retrieval time: {elapsed_time:.6f} seconds (INSTANT!)")
     else:
-        print(f"[STUDENT] ✗ Quiz '{quiz_id}' not found in cache.")
+        lines.append(f"[STUDENT] ✗ Quiz '{quiz_id}' not found in cache.")
+    
+    # Emit the whole report with a single write instead of one print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def retrieve_quizzes_batch(quiz_ids):
+    """
+    Batched retrieval for many concurrent student requests.
+    Returns the cached quiz (or None if missing) for each id, in order,
+    with a single summary log line instead of per-quiz output.
+    """
+    start_time = time.time()
+    
+    quizzes = [lookup_quiz(sys.intern(quiz_id)) for quiz_id in quiz_ids]
+    
+    elapsed_time = time.time() - start_time
+    found = sum(quiz is not None for quiz in quizzes)
+    print(f"\n[STUDENT] Batch retrieved {found}/{len(quiz_ids)} quizzes in {elapsed_time:.6f} seconds")
+    
+    return quizzes
 
 
-def main():
+async def main():
     """
     Final demonstration: Contrast the slow admin cost with instant student benefit.
     """
-    print("=" * 80)
+    print(_BAR80)
     print("AUTOMATED QUIZ GENERATION & CACHING SYSTEM DEMONSTRATION")
-    print("=" * 80)
+    print(_BAR80)
     
     print("\n--- PHASE 1: SLOW ADMIN-SIDE PROCESSING (One-Time Cost) ---")
-    admin_upload_content("Presentation-on-Classroom-Control.pdf", "Week 1")
+    await admin_upload_content("Presentation-on-Classroom-Control.pdf", "Week 1")
+    
+    print("\n--- PHASE 1b: BATCHED ADMIN UPLOADS (Shared LLM Call) ---")
+    worker = asyncio.create_task(batch_worker())
+    pending = [
+        await schedule_upload("Student-Engagement-Strategies.pdf", "Week 2"),
+        await schedule_upload("Group-Activities-Guide.pdf", "Week 2"),
+        await schedule_upload("Assessment-Methods.pdf", "Week 3"),
+    ]
+    await asyncio.gather(*pending)
+    
+    print("\n--- PHASE 1c: REPEAT UPLOADS (Memoized, No Regeneration) ---")
+    await admin_upload_content("Presentation-on-Classroom-Control.pdf", "Week 1")
+    await (await schedule_upload("Student-Engagement-Strategies.pdf", "Week 3"))
+    worker.cancel()
     
     print("\n\n--- PHASE 2: INSTANT STUDENT-SIDE ACCESS (App-Wide Benefit) ---")
     print("(Students can now access quizzes instantly, anytime, anywhere)")
@@ -98,14 +528,20 @@ def main():
     # Demonstrate instant retrieval multiple times
     retrieve_quiz_instantly("Presentation-on-Classroom-Control.pdf")
     retrieve_quiz_instantly("Week 1 Checkpoint")
+    retrieve_quiz_instantly("Week 2 Checkpoint")
+    
+    # Many students at once: one batched lookup instead of one call each
+    retrieve_quizzes_batch(
+        ["Presentation-on-Classroom-Control.pdf", "Week 1 Checkpoint", "Week 2 Checkpoint"] * 1000
+    )
     
-    print("\n" + "=" * 80)
+    print("\n" + _BAR80)
     print("SUMMARY:")
-    print("  • Admin processing: ~7 seconds (ONE TIME)")
+    print("  • Admin processing: ~7 seconds (ONE TIME, shared across a batch)")
     print("  • Student access: <0.001 seconds (EVERY TIME, UNLIMITED STUDENTS)")
     print("  • Result: Instant quiz delivery at scale!")
-    print("=" * 80)
+    print(_BAR80)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
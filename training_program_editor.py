@@ -4,124 +4,165 @@ Admin Training Program Editor
 A command-line tool to manage training program curriculum weeks.
 """
 
+_BAR60 = "=" * 60
+
+
+class TrainingProgram:
+    """
+    Ordered list of training week names.
+    A week's number is its position in the list (index + 1), so reordering
+    never needs a renumbering pass.
+    """
+    __slots__ = ("_names",)
+    
+    def __init__(self, names):
+        self._names = list(names)
+    
+    def __len__(self):
+        return len(self._names)
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def name(self, week_num):
+        """Return the name of the given (1-based) week."""
+        return self._names[week_num - 1]
+    
+    def rename(self, week_num, new_name):
+        """Rename the given (1-based) week and return its old name."""
+        names = self._names
+        old_name = names[week_num - 1]
+        names[week_num - 1] = new_name
+        return old_name
+    
+    def move(self, week_to_move, new_position):
+        """Move a week to a new (1-based) position, shifting the weeks between."""
+        names = self._names
+        week_name = names[week_to_move - 1]
+        
+        # Rotate only the affected range in a single slice assignment
+        # (0-based indexes, so subtract 1 from both positions)
+        src, dst = week_to_move - 1, new_position - 1
+        if src < dst:
+            names[src:dst + 1] = names[src + 1:dst + 1] + [week_name]
+        else:
+            names[dst:src + 1] = [week_name] + names[dst:src]
+
+
 # Initial training program data
-training_program = [
-    {"week_number": 1, "name": "Classroom Management Techniques"},
-    {"week_number": 2, "name": "Student Engagement Strategies"},
-    {"week_number": 3, "name": "Assessment and Evaluation Methods"},
-    {"week_number": 4, "name": "Differentiated Instruction Approaches"},
-    {"week_number": 5, "name": "Technology Integration in Teaching"}
-]
+training_program = TrainingProgram([
+    "Classroom Management Techniques",
+    "Student Engagement Strategies",
+    "Assessment and Evaluation Methods",
+    "Differentiated Instruction Approaches",
+    "Technology Integration in Teaching"
+])
 
 
 def display_all_weeks():
     """Display all training weeks in a formatted list."""
-    print("\n" + "=" * 60)
+    print("\n" + _BAR60)
     print("CURRENT TRAINING PROGRAM")
-    print("=" * 60)
+    print(_BAR60)
     
     if not training_program:
         print("No weeks in the training program.")
     else:
-        for week in training_program:
-            print(f"Week {week['week_number']}: {week['name']}")
+        for week_number, name in enumerate(training_program, 1):
+            print(f"Week {week_number}: {name}")
     
-    print("=" * 60 + "\n")
+    print(_BAR60 + "\n")
+
+
+def read_number(prompt):
+    """Prompt for a non-negative whole number; return None after an error message."""
+    raw = input(prompt).strip()
+    
+    # Validate up front instead of relying on int() raising ValueError
+    if not raw.isdecimal():
+        print("Error: Please enter a valid number.\n")
+        return None
+    
+    return int(raw)
 
 
 def rename_week():
     """Allow the user to rename a specific week."""
     display_all_weeks()
+    week_count = len(training_program)
     
-    if not training_program:
+    if not week_count:
         print("Cannot rename. No weeks available.\n")
         return
     
-    try:
-        week_num = int(input(f"Enter the week number to rename (1-{len(training_program)}): "))
-        
-        if week_num < 1 or week_num > len(training_program):
-            print(f"Error: Please enter a valid week number between 1 and {len(training_program)}.\n")
-            return
-        
-        new_name = input("Enter the new name for this week: ").strip()
-        
-        if not new_name:
-            print("Error: Week name cannot be empty.\n")
-            return
-        
-        # Find and update the week
-        for week in training_program:
-            if week['week_number'] == week_num:
-                old_name = week['name']
-                week['name'] = new_name
-                print(f"\n✓ Successfully renamed Week {week_num}")
-                print(f"  From: {old_name}")
-                print(f"  To:   {new_name}\n")
-                break
-    
-    except ValueError:
-        print("Error: Please enter a valid number.\n")
+    week_num = read_number(f"Enter the week number to rename (1-{week_count}): ")
+    if week_num is None:
+        return
+    
+    if week_num < 1 or week_num > week_count:
+        print(f"Error: Please enter a valid week number between 1 and {week_count}.\n")
+        return
+    
+    new_name = input("Enter the new name for this week: ").strip()
+    
+    if not new_name:
+        print("Error: Week name cannot be empty.\n")
+        return
+    
+    old_name = training_program.rename(week_num, new_name)
+    print(f"\n✓ Successfully renamed Week {week_num}")
+    print(f"  From: {old_name}")
+    print(f"  To:   {new_name}\n")
 
 
 def reorder_weeks():
-    """Move a week to a new position and renumber all weeks sequentially."""
+    """Move a week to a new position; later weeks shift to stay sequential."""
     display_all_weeks()
+    week_count = len(training_program)
     
-    if len(training_program) < 2:
+    if week_count < 2:
         print("Cannot reorder. Need at least 2 weeks in the program.\n")
         return
     
-    try:
-        week_to_move = int(input(f"Enter the week number to move (1-{len(training_program)}): "))
-        
-        if week_to_move < 1 or week_to_move > len(training_program):
-            print(f"Error: Please enter a valid week number between 1 and {len(training_program)}.\n")
-            return
-        
-        new_position = int(input(f"Enter the new position for this week (1-{len(training_program)}): "))
-        
-        if new_position < 1 or new_position > len(training_program):
-            print(f"Error: Please enter a valid position between 1 and {len(training_program)}.\n")
-            return
-        
-        if week_to_move == new_position:
-            print("Week is already at that position. No changes made.\n")
-            return
-        
-        # Find the week to move (by current index, which is week_number - 1)
-        week_data = training_program[week_to_move - 1]
-        week_name = week_data['name']
-        
-        # Remove the week from its current position
-        training_program.pop(week_to_move - 1)
-        
-        # Insert it at the new position (new_position - 1 for 0-based indexing)
-        training_program.insert(new_position - 1, week_data)
-        
-        # Renumber all weeks to maintain sequential order
-        for index, week in enumerate(training_program):
-            week['week_number'] = index + 1
-        
-        print(f"\n✓ Successfully moved '{week_name}'")
-        print(f"  From: Position {week_to_move}")
-        print(f"  To:   Position {new_position}")
-        print("\nAll weeks have been renumbered sequentially.\n")
+    week_to_move = read_number(f"Enter the week number to move (1-{week_count}): ")
+    if week_to_move is None:
+        return
     
-    except ValueError:
-        print("Error: Please enter a valid number.\n")
+    if week_to_move < 1 or week_to_move > week_count:
+        print(f"Error: Please enter a valid week number between 1 and {week_count}.\n")
+        return
+    
+    new_position = read_number(f"Enter the new position for this week (1-{week_count}): ")
+    if new_position is None:
+        return
+    
+    if new_position < 1 or new_position > week_count:
+        print(f"Error: Please enter a valid position between 1 and {week_count}.\n")
+        return
+    
+    if week_to_move == new_position:
+        print("Week is already at that position. No changes made.\n")
+        return
+    
+    week_name = training_program.name(week_to_move)
+    training_program.move(week_to_move, new_position)
+    
+    print(f"\n✓ Successfully moved '{week_name}'")
+    print(f"  From: Position {week_to_move}")
+    print(f"  To:   Position {new_position}")
+    print("\nAll weeks have been renumbered sequentially.\n")
 
 
 def display_menu():
     """Display the main menu options."""
-    print("\n" + "=" * 60)
+    print("\n" + _BAR60)
     print("TRAINING PROGRAM EDITOR - ADMIN PANEL")
-    print("=" * 60)
+    print(_BAR60)
     print("1. Display All Weeks")
     print("2. Rename a Week")
     print("3. Reorder/Shuffle Weeks")
     print("4. Exit")
-    print("=" * 60)
+    print(_BAR60)
 
 
 def main():